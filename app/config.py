@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     explorer_transaction_url: str
     node_url: str
     project_name: str
+    block_time: int = 12
+    confirmations: int = 64
+    historical_cache_max_age: int = 31536000
     model_config = SettingsConfigDict(env_file=f"{BASE_DIR}/.env")
 
 
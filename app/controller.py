@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 from _decimal import Decimal
 from aiohttp import ClientResponseError
@@ -13,6 +13,7 @@ from app.config import settings
 from app.core.database import async_session
 from app.core.exception import (
     AddressNotValidException,
+    BlockNotFoundException,
     InsufficientFundsException,
     NodeException,
     TargetWalletNotValidException,
@@ -85,10 +86,17 @@ class WalletController:
     async def _address_is_valid(self, address) -> bool:
         return self.w3.is_address(address)
 
-    async def _get_balance(self, address) -> Optional[int]:
+    async def _get_balance(self, address, block_identifier: Union[int, str] = 'latest') -> Optional[int]:
         try:
-            return await self.w3.eth.get_balance(address)
-        except ClientResponseError:
+            return await self.w3.eth.get_balance(address, block_identifier)
+        except (ClientResponseError, ValueError):
+            # web3 raises ValueError for rpc errors, e.g. missing trie node or header not found
+            raise NodeException()
+
+    async def _get_block_number(self) -> int:
+        try:
+            return await self.w3.eth.block_number
+        except (ClientResponseError, ValueError):
             raise NodeException()
 
     @classmethod
@@ -105,11 +113,10 @@ class WalletController:
             result = await session.execute(select(Wallet).filter(Wallet.address == address))
             return result.scalar_one_or_none()
 
-    async def get_wallet_with_balance(self, address):
+    async def get_wallet(self, address) -> Wallet:
         """
         validate the address
         get an account
-        get the balance in wei, then convert it to ether
         """
         is_valid = await self._address_is_valid(address=address)
         if not is_valid:
@@ -118,8 +125,25 @@ class WalletController:
         wallet = await self._get_wallet(address)
         if not wallet:
             raise WalletNotFoundException()
+        return wallet
 
-        wei_balance = await self._get_balance(address)
+    async def pin_block(self, block: Optional[int] = None) -> Tuple[int, bool]:
+        """
+        pin the block: the requested one or the current head, a block past the head is not found
+        return the block and whether it has enough confirmations to never change
+        """
+        head = await self._get_block_number()
+        if block is None:
+            block = head
+        elif block > head:
+            raise BlockNotFoundException()
+        return block, head - block >= settings.confirmations
+
+    async def get_wallet_with_balance(self, wallet: Wallet, block: int) -> WalletWithBalance:
+        """
+        get the balance in wei at the pinned block, then convert it to ether
+        """
+        wei_balance = await self._get_balance(wallet.address, block_identifier=block)
         ether_balance = await self._wei_to_ether(wei_balance)
         return WalletWithBalance(
             address=wallet.address,
@@ -127,6 +151,7 @@ class WalletController:
             mnemonic=wallet.mnemonic,
             leaf=wallet.leaf,
             balance=ether_balance,
+            block=block,
         )
 
     async def _gas_price(self):
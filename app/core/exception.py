@@ -17,6 +17,10 @@ class NodeException(Exception):
     pass
 
 
+class BlockNotFoundException(Exception):
+    pass
+
+
 class InsufficientFundsException(Exception):
     def __init__(self, available: Decimal, required: Decimal):
         self.message = 'insufficient funds'
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from sqlalchemy import select
 
+from app.config import settings
 from app.controller import WalletController
 from app.core.database import async_session
 from app.core.exception import (
     AddressNotValidException,
+    BlockNotFoundException,
     InsufficientFundsException,
     NodeException,
     TargetWalletNotValidException,
     WalletNotFoundException,
 )
+from app.core.response import PydanticJSONResponse
 from app.model import Wallet
 from app.schemas import (
     Message,
@@ -24,43 +29,91 @@ from app.schemas import (
 router = APIRouter()
 
 
-@router.post('/create_wallet', status_code=201)
-async def create_wallet_view(data: WalletCreate) -> WalletDetail:
-    return await WalletController().create(data=data)
+def balance_etag(address, block) -> str:
+    return f'"{address}:{block}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match may be "*" or a list of (weak) tags, weak comparison is used
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags
+
+
+def balance_cache_headers(etag: str, final: bool) -> dict:
+    """
+    a balance can change once per block until its block is final, then it never changes
+    the body holds the private key and mnemonic, so only private caches may store it
+    """
+    if final:
+        cache_control = f'private, max-age={settings.historical_cache_max_age}, immutable'
+    else:
+        cache_control = f'private, max-age={settings.block_time}'
+    return {'ETag': etag, 'Cache-Control': cache_control}
+
 
+@router.post('/create_wallet', status_code=201, response_model=WalletDetail)
+async def create_wallet_view(data: WalletCreate) -> PydanticJSONResponse:
+    return PydanticJSONResponse(await WalletController().create(data=data), status_code=201)
 
-@router.get('/wallets')
-async def wallets_view(limit: int = 20, offset: int = 0) -> WalletList:
+
+@router.get('/wallets', response_model=WalletList)
+async def wallets_view(limit: int = 20, offset: int = 0) -> PydanticJSONResponse:
     async with async_session() as session:
         result = await session.execute(select(Wallet).order_by(Wallet.id).limit(limit).offset(offset))
-        return WalletList(result.scalars().all())
+        return PydanticJSONResponse(WalletList.dump_rows(result.scalars()))
 
 
 @router.get(
-    "/wallet/{address}", responses={200: {"model": WalletWithBalance}, 400: {"model": Message}, 404: {"model": Message}}
+    "/wallet/{address}",
+    response_model=WalletWithBalance,
+    responses={
+        200: {"model": WalletWithBalance},
+        304: {"description": "Not Modified"},
+        400: {"model": Message},
+        404: {"model": Message},
+    },
 )
-async def wallet_detail_view(address) -> WalletWithBalance:
+async def wallet_detail_view(
+    address,
+    block: Optional[int] = Query(None, ge=0),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
+    controller = WalletController()
     try:
-        return await WalletController().get_wallet_with_balance(address=address)
+        wallet = await controller.get_wallet(address=address)
+        block, final = await controller.pin_block(block=block)
+        headers = balance_cache_headers(balance_etag(wallet.address, block), final)
+        # answered before the balance call, the etag only depends on (address, block)
+        if etag_matches(if_none_match, headers['ETag']):
+            return Response(status_code=304, headers=headers)
+        wallet_with_balance = await controller.get_wallet_with_balance(wallet=wallet, block=block)
     except AddressNotValidException:
         raise HTTPException(status_code=400, detail="Address Not Valid")
+    except BlockNotFoundException:
+        raise HTTPException(status_code=404, detail="Block Not Found")
     except WalletNotFoundException:
         raise HTTPException(status_code=404, detail="Wallet Not Found")
     except NodeException:
         raise HTTPException(status_code=400, detail="Node Unavailable")
+    return PydanticJSONResponse(wallet_with_balance, headers=headers)
 
 
 @router.post(
     "/wallet/{address}/send",
+    response_model=WalletSendResult,
     responses={
         200: {"model": WalletSendResult},
         400: {"model": Message},
         404: {"model": Message},
     },
 )
-async def send_view(address, data: WalletSend) -> WalletSendResult:
+async def send_view(address, data: WalletSend) -> PydanticJSONResponse:
     try:
-        return await WalletController().send(address=address, data=data)
+        return PydanticJSONResponse(await WalletController().send(address=address, data=data))
     except AddressNotValidException:
         raise HTTPException(status_code=400, detail="From Address Not Valid")
     except TargetWalletNotValidException:
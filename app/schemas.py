@@ -1,11 +1,27 @@
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional
 
 from _decimal import Decimal
 from pydantic import BaseModel, ConfigDict, RootModel, computed_field, field_validator
+from pydantic_core import to_json
 
 from app.config import settings
 
 
+def compile_url_template(template: str, field: str) -> Callable[[str], str]:
+    """
+    split the template around its placeholder once, so building an url is a plain concatenation
+    templates with other braces fall back to str.format
+    """
+    prefix, placeholder, suffix = template.partition(f'{{{field}}}')
+    if not placeholder or any(brace in prefix + suffix for brace in '{}'):
+        return lambda value: template.format(**{field: value})
+    return lambda value: f'{prefix}{value}{suffix}'
+
+
+address_url = compile_url_template(settings.explorer_address_url, 'address')
+transaction_url = compile_url_template(settings.explorer_transaction_url, 'tx_id')
+
+
 class WalletDetail(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     address: str
@@ -15,11 +31,12 @@ class WalletDetail(BaseModel):
 
     @computed_field
     def explorer_url(self) -> str:
-        return settings.explorer_address_url.format(address=self.address)
+        return address_url(self.address)
 
 
 class WalletWithBalance(WalletDetail):
     balance: Decimal
+    block: int
 
     @field_validator("balance")
     @classmethod
@@ -41,12 +58,26 @@ class WalletSendResult(BaseModel):
 
     @computed_field
     def explorer_url(self) -> str:
-        return settings.explorer_transaction_url.format(tx_id=self.transaction_id)
+        return transaction_url(self.transaction_id)
 
 
 class WalletList(RootModel):
     root: List[WalletDetail]
 
+    @classmethod
+    def dump_rows(cls, rows: Iterable) -> bytes:
+        """
+        encode orm rows directly to json bytes without building WalletDetail models
+        fields are taken from WalletDetail, followed by the computed explorer_url
+        """
+        fields = tuple(WalletDetail.model_fields)
+        return to_json(
+            [
+                {**{field: getattr(row, field) for field in fields}, 'explorer_url': address_url(row.address)}
+                for row in rows
+            ]
+        )
+
 
 class Message(BaseModel):
     detail: str
@@ -1,6 +1,15 @@
 from unittest.mock import patch
 
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.controller import WalletController
 from app.core.exception import NodeException
+from app.schemas import WalletList
+
+
+def default_render(model) -> bytes:
+    return JSONResponse(jsonable_encoder(model)).body
 
 
 async def test_create_wallet_with_mnemonic(client, wallet_data):
@@ -41,6 +50,13 @@ async def test_wallets_list(client, wallets):
     assert len(response.json()) == len(wallets)
 
 
+async def test_wallets_list_bytes(client, wallets):
+    response = await client.get('/wallets')
+
+    assert response.status_code == 200
+    assert response.content == default_render(WalletList(wallets))
+
+
 async def test_wallets_list_without_pagination(client, wallets):
     response = await client.get('/wallets?limit=1&offset=0')
 
@@ -48,7 +64,7 @@ async def test_wallets_list_without_pagination(client, wallets):
     assert len(response.json()) == 1
 
 
-async def test_wallet_detail(client, wallet):
+async def test_wallet_detail(client, wallet, block_number):
     with patch('app.controller.WalletController._get_balance') as provider_mock:
         provider_mock.return_value = 1000000000000000000
         response = await client.get(f'/wallet/{wallet.address}')
@@ -60,6 +76,121 @@ async def test_wallet_detail(client, wallet):
         assert data['mnemonic'] == wallet.mnemonic
         assert data['leaf'] == wallet.leaf
         assert data['balance'] == '1.000000000000000000'
+        assert data['block'] == block_number.return_value
+
+
+async def test_wallet_detail_bytes(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        provider_mock.return_value = 1000000000000000000
+        response = await client.get(f'/wallet/{wallet.address}')
+
+        wallet_with_balance = await WalletController().get_wallet_with_balance(
+            wallet=wallet, block=block_number.return_value
+        )
+        assert response.content == default_render(wallet_with_balance)
+
+
+async def test_wallet_detail_cache_headers(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        provider_mock.return_value = 1
+        response = await client.get(f'/wallet/{wallet.address}')
+
+        assert response.status_code == 200
+        assert response.headers['etag'] == f'"{wallet.address}:{block_number.return_value}"'
+        assert response.headers['cache-control'] == 'private, max-age=12'
+        provider_mock.assert_called_once_with(wallet.address, block_identifier=block_number.return_value)
+
+
+async def test_wallet_detail_not_modified(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        etag = f'"{wallet.address}:{block_number.return_value}"'
+        response = await client.get(f'/wallet/{wallet.address}', headers={'If-None-Match': f'"other", W/{etag}'})
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+        provider_mock.assert_not_called()
+
+
+async def test_wallet_detail_head_moved(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        provider_mock.return_value = 1
+        etag = f'"{wallet.address}:{block_number.return_value - 1}"'
+        response = await client.get(f'/wallet/{wallet.address}', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+        provider_mock.assert_called_once()
+
+
+async def test_wallet_detail_historical(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        provider_mock.return_value = 1
+        response = await client.get(f'/wallet/{wallet.address}?block=17000000')
+
+        assert response.status_code == 200
+        assert response.json()['block'] == 17000000
+        assert response.headers['etag'] == f'"{wallet.address}:17000000"'
+        assert response.headers['cache-control'] == 'private, max-age=31536000, immutable'
+        provider_mock.assert_called_once_with(wallet.address, block_identifier=17000000)
+
+
+async def test_wallet_detail_historical_not_modified(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        response = await client.get(
+            f'/wallet/{wallet.address}?block=17000000', headers={'If-None-Match': f'"{wallet.address}:17000000"'}
+        )
+
+        assert response.status_code == 304
+        assert response.headers['cache-control'] == 'private, max-age=31536000, immutable'
+        provider_mock.assert_not_called()
+
+
+async def test_wallet_detail_block_not_found(client, wallet, block_number):
+    response = await client.get(f'/wallet/{wallet.address}?block={block_number.return_value + 1}')
+
+    assert response.status_code == 404
+    assert response.json()['detail'] == 'Block Not Found'
+
+
+async def test_wallet_detail_block_not_found_not_modified(client, wallet, block_number):
+    block = block_number.return_value + 1
+    response = await client.get(
+        f'/wallet/{wallet.address}?block={block}', headers={'If-None-Match': f'"{wallet.address}:{block}"'}
+    )
+
+    assert response.status_code == 404
+    assert 'cache-control' not in response.headers
+
+
+async def test_wallet_detail_historical_node_error(client, wallet, block_number):
+    with patch('web3.eth.AsyncEth.get_balance') as get_balance_mock:
+        get_balance_mock.side_effect = ValueError({'code': -32000, 'message': 'missing trie node'})
+        response = await client.get(f'/wallet/{wallet.address}?block=17000000')
+
+        assert response.status_code == 400
+        assert response.json()['detail'] == 'Node Unavailable'
+
+
+async def test_wallet_detail_head_not_found(client, wallet, block_number):
+    with patch('web3.eth.AsyncEth.get_balance') as get_balance_mock:
+        get_balance_mock.side_effect = ValueError({'code': -32000, 'message': 'header not found'})
+        response = await client.get(f'/wallet/{wallet.address}')
+
+        assert response.status_code == 400
+        assert response.json()['detail'] == 'Node Unavailable'
+        get_balance_mock.assert_called_once_with(wallet.address, block_number.return_value)
+
+
+async def test_wallet_detail_historical_final_boundary(client, wallet, block_number):
+    with patch('app.controller.WalletController._get_balance') as provider_mock:
+        provider_mock.return_value = 1
+        final_block = block_number.return_value - 64
+        response = await client.get(f'/wallet/{wallet.address}?block={final_block}')
+        assert response.headers['cache-control'] == 'private, max-age=31536000, immutable'
+
+        response = await client.get(f'/wallet/{wallet.address}?block={final_block + 1}')
+        assert response.headers['cache-control'] == 'private, max-age=12'
 
 
 async def test_wallet_detail_invalid_address(client):
@@ -77,7 +208,7 @@ async def test_wallet_detail_not_found(client):
     assert response.json()['detail'] == 'Wallet Not Found'
 
 
-async def test_wallet_detail_not_connected(client, wallet):
+async def test_wallet_detail_not_connected(client, wallet, block_number):
     with patch('app.controller.WalletController._get_balance') as provider_mock:
         provider_mock.side_effect = NodeException()
         response = await client.get(f'/wallet/{wallet.address}')
@@ -87,7 +218,7 @@ async def test_wallet_detail_not_connected(client, wallet):
         assert data['detail'] == "Node Unavailable"
 
 
-async def test_wallet_detail_balance_zero(client, wallet):
+async def test_wallet_detail_balance_zero(client, wallet, block_number):
     with patch('app.controller.WalletController._get_balance') as provider_mock:
         provider_mock.return_value = 1
         response = await client.get(f'/wallet/{wallet.address}')
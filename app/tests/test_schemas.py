@@ -0,0 +1,14 @@
+from types import SimpleNamespace
+
+from app.schemas import WalletList, compile_url_template
+
+
+def test_compile_url_template():
+    assert compile_url_template('https://etherscan.io/tx/{tx_id}', 'tx_id')('0x1') == 'https://etherscan.io/tx/0x1'
+    assert compile_url_template('https://x.io/{{a}}/{address}', 'address')('0x1') == 'https://x.io/{a}/0x1'
+
+
+def test_wallet_list_dump_rows(wallet_data):
+    rows = [SimpleNamespace(**wallet_data), SimpleNamespace(**{**wallet_data, 'leaf': 1})]
+
+    assert WalletList.dump_rows(rows) == WalletList(rows).model_dump_json().encode('utf-8')
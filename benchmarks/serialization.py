@@ -0,0 +1,45 @@
+"""
+per-item cost of the default FastAPI encoding against the direct row encoding of /wallets
+
+usage: python -m benchmarks.serialization [items]
+"""
+import sys
+import timeit
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas import WalletList
+
+
+def make_rows(count: int) -> list:
+    return [
+        SimpleNamespace(
+            address=f'0x{index:040x}',
+            private_key=f'{index:064x}',
+            mnemonic='alter phrase erupt aun glory media want aun noble tooth fine aun',
+            leaf=index,
+        )
+        for index in range(count)
+    ]
+
+
+def default_path(rows) -> bytes:
+    return JSONResponse(jsonable_encoder(WalletList(rows))).body
+
+
+def direct_path(rows) -> bytes:
+    return WalletList.dump_rows(rows)
+
+
+def main(count: int = 1000, repeat: int = 20):
+    rows = make_rows(count)
+    assert default_path(rows) == direct_path(rows), 'serialization output differs'
+    for name, func in (('default', default_path), ('direct', direct_path)):
+        best = min(timeit.repeat(lambda: func(rows), number=1, repeat=repeat))
+        print(f'{name:>8}: {best / count * 1e6:.2f} us/item ({count} items)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
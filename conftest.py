@@ -1,4 +1,5 @@
 import asyncio
+from unittest.mock import patch
 
 import asyncpg
 import pytest
@@ -99,3 +100,10 @@ async def wallets(session):
 @pytest_asyncio.fixture(scope="function")
 async def wallet(wallets):
     return wallets[0]
+
+
+@pytest.fixture
+def block_number():
+    with patch('app.controller.WalletController._get_block_number') as block_mock:
+        block_mock.return_value = 18000000
+        yield block_mock